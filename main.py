@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -5,12 +6,18 @@ from pykdm import DCPCreator, KDMGenerator, KDMType
 
 
 def main():
+    # The two version checks are independent subprocesses, so run them
+    # concurrently instead of one after the other.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dcp_version = executor.submit(lambda: DCPCreator().version())
+        kdm_version = executor.submit(lambda: KDMGenerator().version())
+
     # Example: Create a DCP
     try:
-        dcp_creator = DCPCreator()
-        print(f"DCP-o-matic version: {dcp_creator.version()}")
+        print(f"DCP-o-matic version: {dcp_version.result()}")
 
         # Create DCP from project
+        # dcp_creator = DCPCreator()
         # result = dcp_creator.create(
         #     project=Path("/path/to/project.dcp"),
         #     output=Path("/path/to/output"),
@@ -23,10 +30,10 @@ def main():
 
     # Example: Generate KDM
     try:
-        kdm_generator = KDMGenerator()
-        print(f"KDM CLI version: {kdm_generator.version()}")
+        print(f"KDM CLI version: {kdm_version.result()}")
 
         # Generate KDM for a DCP
+        # kdm_generator = KDMGenerator()
         # valid_from = datetime.now()
         # valid_to = valid_from + timedelta(days=7)
         #
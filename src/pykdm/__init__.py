@@ -1,17 +1,6 @@
+import importlib
+
 from .dcp import DCPCreator
-from .kdm import KDMGenerator, KDMType
-from .project import (
-    DCPProjectCreator,
-    DCPContentType,
-    ContainerRatio,
-    DCPStandard,
-    Resolution,
-    Dimension,
-    ContentItem,
-    AudioChannel,
-    Eye,
-)
-from .certificate import CertificateGenerator, CertificateResult, DCIRole
 from .exceptions import (
     PyKDMError,
     DCPCreationError,
@@ -20,10 +9,55 @@ from .exceptions import (
     CertificateGenerationError,
 )
 
+# Heavier submodules are imported on first attribute access (PEP 562).
+_LAZY = {
+    "KDMGenerator": ".kdm",
+    "KDMType": ".kdm",
+    "KDMResult": ".kdm",
+    "get_generator": ".kdm",
+    "DCPProjectCreator": ".project",
+    "DCPContentType": ".project",
+    "ContainerRatio": ".project",
+    "DCPStandard": ".project",
+    "Resolution": ".project",
+    "Dimension": ".project",
+    "ContentItem": ".project",
+    "AudioChannel": ".project",
+    "Eye": ".project",
+    "CertificateGenerator": ".certificate",
+    "CertificateResult": ".certificate",
+    "DCIRole": ".certificate",
+    "load_pem": ".certs",
+}
+
+
+# Submodules that used to be loaded by the eager imports, so code relying on
+# e.g. ``pykdm.kdm`` after a bare ``import pykdm`` keeps working.
+_SUBMODULES = frozenset({"kdm", "project", "certificate"})
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
+
+
 __all__ = [
     "DCPCreator",
     "KDMGenerator",
     "KDMType",
+    "KDMResult",
+    "get_generator",
     "PyKDMError",
     "DCPCreationError",
     "KDMGenerationError",
@@ -40,5 +74,6 @@ __all__ = [
     "CertificateGenerator",
     "CertificateResult",
     "DCIRole",
+    "load_pem",
     "CertificateGenerationError",
 ]
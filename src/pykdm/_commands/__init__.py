@@ -0,0 +1 @@
+"""Subcommand implementations loaded on demand by ``pykdm.cli.LazyGroup``."""
@@ -0,0 +1,7 @@
+import click
+
+from ..kdm import KDMType
+
+
+KDM_TYPES = tuple(t.value for t in KDMType)
+KDM_TYPE_CHOICE = click.Choice(KDM_TYPES, case_sensitive=False)
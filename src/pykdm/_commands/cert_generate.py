@@ -0,0 +1,87 @@
+import click
+from pathlib import Path
+
+from ..certificate import CertificateGenerator, DCIRole
+from ..exceptions import CertificateGenerationError
+
+
+@click.command("generate")
+@click.argument("output", type=click.Path(path_type=Path))
+@click.option(
+    "-m", "--manufacturer", default="TestManufacturer", help="Device manufacturer name."
+)
+@click.option("-M", "--model", default="TestProjector", help="Device model name.")
+@click.option("-s", "--serial", default="12345", help="Device serial number.")
+@click.option(
+    "-r",
+    "--role",
+    type=click.Choice([r.name for r in DCIRole], case_sensitive=False),
+    default=DCIRole.PROJECTOR.name,
+    help="DCI role for the certificate.",
+)
+@click.option(
+    "-o", "--organization", help="Organization name (defaults to manufacturer)."
+)
+@click.option(
+    "-d",
+    "--validity-days",
+    default=3650,
+    type=int,
+    help="Validity period in days (default: 3650).",
+)
+@click.option("--no-key", is_flag=True, help="Don't save the private key.")
+@click.option(
+    "--key-size", default=2048, type=int, help="RSA key size in bits (default: 2048)."
+)
+def cert_generate(
+    output: Path,
+    manufacturer: str,
+    model: str,
+    serial: str,
+    role: str,
+    organization: str | None,
+    validity_days: int,
+    no_key: bool,
+    key_size: int,
+):
+    """Generate a test DCI-style projector certificate.
+
+    OUTPUT is the path for the certificate file (.pem).
+
+    This creates a self-signed certificate that mimics the structure of
+    DCI projector certificates. Useful for testing KDM generation workflows.
+
+    NOTE: These certificates are for testing only and won't work with
+    real DCI infrastructure (not signed by a trusted DCI CA).
+
+    \b
+    Examples:
+      pykdm cert generate test_projector.pem
+      pykdm cert generate projector.pem -m Barco -M DP2K -s ABC123
+      pykdm cert generate cert.pem --role LINK_DECRYPTOR --validity-days 365
+    """
+    try:
+        generator = CertificateGenerator(key_size=key_size)
+        role_enum = DCIRole[role]
+
+        click.echo(f"Generating test certificate...")
+        result = generator.generate(
+            output=output,
+            manufacturer=manufacturer,
+            model=model,
+            serial=serial,
+            role=role_enum,
+            organization=organization,
+            validity_days=validity_days,
+            save_private_key=not no_key,
+        )
+
+        click.echo(f"Certificate created: {result.certificate_path}")
+        if result.private_key_path:
+            click.echo(f"Private key created: {result.private_key_path}")
+        click.echo(f"Thumbprint: {result.thumbprint}")
+    except CertificateGenerationError as e:
+        raise click.ClickException(str(e))
+
+
+command = cert_generate
@@ -0,0 +1,71 @@
+import click
+from pathlib import Path
+
+from ..certificate import CertificateGenerator
+from ..exceptions import CertificateGenerationError
+
+
+@click.command("generate-chain")
+@click.argument("output_dir", type=click.Path(path_type=Path))
+@click.option(
+    "-m", "--manufacturer", default="TestManufacturer", help="Device manufacturer name."
+)
+@click.option("-M", "--model", default="TestProjector", help="Device model name.")
+@click.option("-s", "--serial", default="12345", help="Device serial number.")
+@click.option(
+    "-d",
+    "--validity-days",
+    default=3650,
+    type=int,
+    help="Validity period in days (default: 3650).",
+)
+@click.option(
+    "--key-size", default=2048, type=int, help="RSA key size in bits (default: 2048)."
+)
+def cert_generate_chain(
+    output_dir: Path,
+    manufacturer: str,
+    model: str,
+    serial: str,
+    validity_days: int,
+    key_size: int,
+):
+    """Generate a test CA + leaf certificate chain.
+
+    OUTPUT_DIR is the directory where certificates will be created.
+
+    This creates:
+      - ca.pem / ca.key.pem: Self-signed CA certificate
+      - leaf.pem / leaf.key.pem: Leaf certificate signed by the CA
+
+    Useful for testing more realistic certificate chain scenarios.
+
+    \b
+    Examples:
+      pykdm cert generate-chain ./test-certs
+      pykdm cert generate-chain ./certs -m Barco -M DP4K -s XYZ789
+    """
+    try:
+        generator = CertificateGenerator(key_size=key_size)
+
+        click.echo(f"Generating certificate chain...")
+        ca_result, leaf_result = generator.generate_chain(
+            output_dir=output_dir,
+            manufacturer=manufacturer,
+            model=model,
+            serial=serial,
+            validity_days=validity_days,
+        )
+
+        click.echo(f"CA certificate: {ca_result.certificate_path}")
+        click.echo(f"CA private key: {ca_result.private_key_path}")
+        click.echo(f"CA thumbprint: {ca_result.thumbprint}")
+        click.echo()
+        click.echo(f"Leaf certificate: {leaf_result.certificate_path}")
+        click.echo(f"Leaf private key: {leaf_result.private_key_path}")
+        click.echo(f"Leaf thumbprint: {leaf_result.thumbprint}")
+    except CertificateGenerationError as e:
+        raise click.ClickException(str(e))
+
+
+command = cert_generate_chain
@@ -0,0 +1,48 @@
+import click
+from pathlib import Path
+
+from ..dcp import DCPCreator
+from ..exceptions import DCPCreationError
+
+
+@click.command("create")
+@click.argument("project", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    help="Output directory for the DCP.",
+)
+@click.option("-e", "--encrypt", is_flag=True, help="Encrypt the DCP.")
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_cli binary.",
+)
+def dcp_create(
+    project: Path, output: Path | None, encrypt: bool, bin_path: Path | None
+):
+    """Create a DCP from a DCP-o-matic project.
+
+    PROJECT is the path to a .dcp project file or project directory.
+    """
+    try:
+        creator = DCPCreator(dcpomatic_path=bin_path)
+        click.echo(f"Creating DCP from {project}...")
+
+        result = creator.create(
+            project=project,
+            output=output,
+            encrypt=encrypt,
+            progress_callback=lambda p: click.echo(f"\r{p:.0%}", nl=False),
+        )
+
+        # Leading \r overwrites the progress indicator.
+        click.echo(f"\rDCP created successfully at: {result.output_path}")
+        if result.stdout:
+            click.echo(result.stdout)
+    except DCPCreationError as e:
+        raise click.ClickException(str(e))
+
+
+command = dcp_create
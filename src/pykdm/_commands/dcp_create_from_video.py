@@ -0,0 +1,241 @@
+import click
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from ..project import (
+    DCPProjectCreator,
+    DCPContentType,
+    ContainerRatio,
+    DCPStandard,
+    Resolution,
+)
+from ..exceptions import CLIError, DCPCreationError, DCPProjectCreationError
+
+
+_CONTENT_TYPES = tuple(t.value for t in DCPContentType)
+_RATIOS = tuple(r.value for r in ContainerRatio)
+_STANDARDS = tuple(s.value for s in DCPStandard)
+
+
+def _create_per_file(
+    creator: DCPProjectCreator,
+    content_paths: list[Path],
+    output: Path,
+    dcp_output: Path | None,
+    build: bool,
+    jobs: int,
+    dcpomatic_cli_path: Path | None,
+    options: dict,
+) -> None:
+    """Create (and optionally build) one project per content file concurrently."""
+    stems = [path.stem for path in content_paths]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        raise click.ClickException(
+            f"Duplicate content file names with --per-file: {', '.join(duplicates)}"
+        )
+
+    def pipeline(path: Path):
+        project_output = output / path.stem
+        if build:
+            return creator.create_and_build(
+                content=path,
+                output=project_output,
+                dcp_output=dcp_output / path.stem if dcp_output else None,
+                dcpomatic_cli_path=dcpomatic_cli_path,
+                **options,
+            )
+        return creator.create(content=path, output=project_output, **options), None
+
+    click.echo(f"Creating {len(content_paths)} project(s) with {jobs} job(s)...")
+    failures = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(pipeline, path): path for path in content_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                project_result, dcp_result = future.result()
+            except (DCPProjectCreationError, DCPCreationError, CLIError) as e:
+                failures += 1
+                click.echo(f"{path.name}: {e}", err=True)
+                continue
+            click.echo(f"{path.name}: project created at {project_result.output_path}")
+            if dcp_result:
+                click.echo(f"{path.name}: DCP created at {dcp_result.output_path}")
+
+    if failures:
+        raise click.ClickException(f"{failures} of {len(content_paths)} file(s) failed")
+
+
+@click.command("create-from-video")
+@click.argument(
+    "content", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path)
+)
+@click.option(
+    "-o",
+    "--output",
+    required=True,
+    type=click.Path(path_type=Path),
+    help="Output directory for the project.",
+)
+@click.option(
+    "-n", "--name", help="Film name (used for every project with --per-file)."
+)
+@click.option("-e", "--encrypt", is_flag=True, help="Create encrypted DCP.")
+@click.option(
+    "-c",
+    "--content-type",
+    type=click.Choice(_CONTENT_TYPES, case_sensitive=False),
+    help="DCP content type.",
+)
+@click.option(
+    "--container-ratio",
+    type=click.Choice(_RATIOS, case_sensitive=False),
+    help="Container aspect ratio.",
+)
+@click.option(
+    "--twok/--fourk",
+    "resolution",
+    default=True,
+    flag_value=True,
+    help="Resolution (default: 2K).",
+)
+@click.option(
+    "--standard",
+    type=click.Choice(_STANDARDS, case_sensitive=False),
+    help="DCP standard (smpte or interop).",
+)
+@click.option(
+    "--build", is_flag=True, help="Also build the DCP after creating project."
+)
+@click.option(
+    "--dcp-output",
+    type=click.Path(path_type=Path),
+    help="Output directory for built DCP (with --build).",
+)
+@click.option(
+    "--per-file",
+    is_flag=True,
+    help="Create a separate project (in OUTPUT/<file name>) for each CONTENT file.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=max(1, (os.cpu_count() or 2) // 2),
+    show_default=True,
+    help="Number of projects processed concurrently (with --per-file).",
+)
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_create binary.",
+)
+@click.option(
+    "--cli-bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_cli binary (for --build).",
+)
+def dcp_create_from_video(
+    content: tuple[Path, ...],
+    output: Path,
+    name: str | None,
+    encrypt: bool,
+    content_type: str | None,
+    container_ratio: str | None,
+    resolution: bool,
+    standard: str | None,
+    build: bool,
+    dcp_output: Path | None,
+    per_file: bool,
+    jobs: int,
+    bin_path: Path | None,
+    cli_bin_path: Path | None,
+):
+    """Create a DCP-o-matic project from video/audio files.
+
+    CONTENT is one or more paths to video or audio files.
+
+    \b
+    Examples:
+      pykdm dcp create-from-video video.mp4 -o ./my-project -n "My Film"
+      pykdm dcp create-from-video video.mp4 audio.wav -o ./project --build
+      pykdm dcp create-from-video video.mp4 -o ./project -e --build --dcp-output ./dcp
+      pykdm dcp create-from-video a.mp4 b.mp4 -o ./projects --per-file -j 2 --build
+    """
+    try:
+        creator = DCPProjectCreator(dcpomatic_create_path=bin_path)
+
+        # Convert option strings to enums
+        content_type_enum = DCPContentType(content_type) if content_type else None
+        container_ratio_enum = (
+            ContainerRatio(container_ratio) if container_ratio else None
+        )
+        standard_enum = DCPStandard(standard) if standard else None
+        resolution_enum = Resolution.TWO_K if resolution else Resolution.FOUR_K
+
+        content_paths = list(content)
+
+        if per_file:
+            _create_per_file(
+                creator,
+                content_paths,
+                output=output,
+                dcp_output=dcp_output,
+                build=build,
+                jobs=jobs,
+                dcpomatic_cli_path=cli_bin_path,
+                options={
+                    "name": name,
+                    "encrypt": encrypt,
+                    "content_type": content_type_enum,
+                    "container_ratio": container_ratio_enum,
+                    "standard": standard_enum,
+                    "resolution": resolution_enum,
+                },
+            )
+        elif build:
+            click.echo(
+                f"Creating project and building DCP from {len(content_paths)} file(s)..."
+            )
+            project_result, dcp_result = creator.create_and_build(
+                content=content_paths,
+                output=output,
+                dcp_output=dcp_output,
+                name=name,
+                encrypt=encrypt,
+                content_type=content_type_enum,
+                container_ratio=container_ratio_enum,
+                standard=standard_enum,
+                resolution=resolution_enum,
+                dcpomatic_cli_path=cli_bin_path,
+            )
+            click.echo(f"Project created at: {project_result.output_path}")
+            click.echo(f"DCP created at: {dcp_result.output_path}")
+            if project_result.stdout:
+                click.echo(project_result.stdout)
+            if dcp_result.stdout:
+                click.echo(dcp_result.stdout)
+        else:
+            click.echo(f"Creating project from {len(content_paths)} file(s)...")
+            result = creator.create(
+                content=content_paths,
+                output=output,
+                name=name,
+                encrypt=encrypt,
+                content_type=content_type_enum,
+                container_ratio=container_ratio_enum,
+                standard=standard_enum,
+                resolution=resolution_enum,
+            )
+            click.echo(f"Project created successfully at: {result.output_path}")
+            if result.stdout:
+                click.echo(result.stdout)
+    except DCPProjectCreationError as e:
+        raise click.ClickException(str(e))
+    except DCPCreationError as e:
+        raise click.ClickException(str(e))
+
+
+command = dcp_create_from_video
@@ -0,0 +1,23 @@
+import click
+from pathlib import Path
+
+from ..project import DCPProjectCreator
+from ..exceptions import DCPProjectCreationError
+
+
+@click.command("project-version")
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_create binary.",
+)
+def dcp_project_version(bin_path: Path | None):
+    """Show dcpomatic2_create version."""
+    try:
+        creator = DCPProjectCreator(dcpomatic_create_path=bin_path)
+        click.echo(creator.version())
+    except DCPProjectCreationError as e:
+        raise click.ClickException(str(e))
+
+
+command = dcp_project_version
@@ -0,0 +1,23 @@
+import click
+from pathlib import Path
+
+from ..dcp import DCPCreator
+from ..exceptions import DCPCreationError
+
+
+@click.command("version")
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_cli binary.",
+)
+def dcp_version(bin_path: Path | None):
+    """Show dcpomatic2_cli version."""
+    try:
+        creator = DCPCreator(dcpomatic_path=bin_path)
+        click.echo(creator.version())
+    except DCPCreationError as e:
+        raise click.ClickException(str(e))
+
+
+command = dcp_version
@@ -0,0 +1,95 @@
+import click
+from datetime import datetime
+from pathlib import Path
+
+from ..cli import DATETIME
+from ._choices import KDM_TYPE_CHOICE
+from ..kdm import KDMGenerator, KDMType
+from ..exceptions import KDMGenerationError
+
+
+@click.command("generate")
+@click.argument("project", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "-c",
+    "--certificate",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Path to the target certificate (.pem).",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    required=True,
+    help="Output path for the KDM file.",
+)
+@click.option(
+    "-f",
+    "--valid-from",
+    type=DATETIME,
+    required=True,
+    help="Start of validity period (YYYY-MM-DD or YYYY-MM-DD HH:MM).",
+)
+@click.option(
+    "-t",
+    "--valid-to",
+    type=DATETIME,
+    required=True,
+    help="End of validity period (YYYY-MM-DD or YYYY-MM-DD HH:MM).",
+)
+@click.option(
+    "-K",
+    "--kdm-type",
+    type=KDM_TYPE_CHOICE,
+    default=KDMType.MODIFIED_TRANSITIONAL_1.value,
+    help="KDM output format type.",
+)
+@click.option("--cinema-name", help="Cinema name for the KDM.")
+@click.option("--screen-name", help="Screen name for the KDM.")
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_kdm_cli binary.",
+)
+def kdm_generate(
+    project: Path,
+    certificate: Path,
+    output: Path,
+    valid_from: datetime,
+    valid_to: datetime,
+    kdm_type: str,
+    cinema_name: str | None,
+    screen_name: str | None,
+    bin_path: Path | None,
+):
+    """Generate a KDM for an encrypted DCP.
+
+    PROJECT is the path to the DCP-o-matic project folder (the folder
+    containing metadata.xml), not the DCP output subfolder.
+    """
+    try:
+        generator = KDMGenerator(dcpomatic_kdm_path=bin_path)
+
+        kdm_type_enum = KDMType(kdm_type)
+
+        click.echo(f"Generating KDM for {project}...")
+        result = generator.generate(
+            project=project,
+            certificate=certificate,
+            output=output,
+            valid_from=valid_from,
+            valid_to=valid_to,
+            kdm_type=kdm_type_enum,
+            cinema_name=cinema_name,
+            screen_name=screen_name,
+        )
+
+        click.echo(f"KDM created successfully at: {result.output_path}")
+        if result.stdout:
+            click.echo(result.stdout)
+    except KDMGenerationError as e:
+        raise click.ClickException(str(e))
+
+
+command = kdm_generate
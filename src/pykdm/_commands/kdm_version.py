@@ -0,0 +1,23 @@
+import click
+from pathlib import Path
+
+from ..kdm import KDMGenerator
+from ..exceptions import KDMGenerationError
+
+
+@click.command("version")
+@click.option(
+    "--bin-path",
+    type=click.Path(exists=True, path_type=Path),
+    help="Path to dcpomatic2_kdm_cli binary.",
+)
+def kdm_version(bin_path: Path | None):
+    """Show dcpomatic2_kdm_cli version."""
+    try:
+        generator = KDMGenerator(dcpomatic_kdm_path=bin_path)
+        click.echo(generator.version())
+    except KDMGenerationError as e:
+        raise click.ClickException(str(e))
+
+
+command = kdm_version
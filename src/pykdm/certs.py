@@ -0,0 +1,33 @@
+"""Certificate file helpers that do not need the cryptography package."""
+
+import functools
+import os
+from pathlib import Path
+
+
+def load_pem(path: str | os.PathLike[str]) -> bytes:
+    """
+    Read a PEM file, reusing the bytes from earlier reads.
+
+    A cinema chain's certificates are read for every KDM generated for them.
+    The cache is keyed on the absolute path and the file's modification
+    time, size and inode, so a rewritten or replaced certificate is picked
+    up on the next call.
+
+    Args:
+        path: Path to the PEM file.
+
+    Returns:
+        The raw file contents.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    return _load_pem_cached(key, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_pem_cached(path: str, mtime_ns: int, size: int, ino: int) -> bytes:
+    return Path(path).read_bytes()
@@ -1,3 +1,6 @@
+import functools
+import os
+import warnings
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Callable
@@ -16,18 +19,40 @@ class DCPResult:
     stderr: str
 
 
+@functools.cache
+def _cpu_has_aes() -> bool | None:
+    """Return whether the CPU advertises AES instructions (None if unknown)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return None
+    for line in cpuinfo.splitlines():
+        # x86 reports "flags", ARM reports "Features"
+        if line.startswith(("flags", "Features")):
+            return "aes" in line.partition(":")[2].split()
+    return None
+
+
 class DCPCreator:
     """Wrapper for dcpomatic2_cli to create Digital Cinema Packages."""
 
-    def __init__(self, dcpomatic_path: str | None = None):
+    def __init__(
+        self,
+        dcpomatic_path: str | os.PathLike[str] | None = None,
+        require_aes_ni: bool = False,
+    ):
         """
         Initialize the DCP creator.
 
         Args:
             dcpomatic_path: Path to dcpomatic2_cli binary.
                           If None, searches in PATH.
+            require_aes_ni: Refuse to create encrypted DCPs when the CPU
+                          lacks hardware AES support instead of warning.
         """
         self.runner = Runner("dcpomatic2_cli", dcpomatic_path)
+        self.require_aes_ni = require_aes_ni
 
     def create(
         self,
@@ -54,6 +79,9 @@ class DCPCreator:
         if not project.exists():
             raise DCPCreationError(f"Project not found: {project}")
 
+        if encrypt:
+            self._check_aes_ni()
+
         cmd = []
 
         if output:
@@ -66,8 +94,24 @@ class DCPCreator:
         cmd.append(str(project))
 
         return self.runner.run(
-            *cmd, output_path=output or project, error_prefix="DCP creation"
+            *cmd,
+            output_path=output or project,
+            error_prefix="DCP creation",
+            progress_callback=progress_callback,
+        )
+
+    def _check_aes_ni(self) -> None:
+        """Warn (or raise) when encryption would run without hardware AES."""
+        if _cpu_has_aes() is not False:
+            return
+
+        message = (
+            "CPU does not support hardware AES (AES-NI); "
+            "DCP encryption will be considerably slower"
         )
+        if self.require_aes_ni:
+            raise DCPCreationError(message)
+        warnings.warn(message, RuntimeWarning, stacklevel=3)
 
     def version(self) -> str:
         """Get dcpomatic2_cli version."""
@@ -1,7 +1,10 @@
+import functools
+import os
+import time
 from pathlib import Path
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Any, Mapping, Sequence
 
 from .exceptions import KDMGenerationError
 from .runner import Runner, CLIResult
@@ -15,20 +18,65 @@ class KDMType(Enum):
     DCI_SPECIFIC = "dci-specific"
 
 
-@dataclass
-class KDMResult:
-    """Result of KDM generation."""
+# KDM methods return the Runner's result type; the alias keeps the name.
+KDMResult = CLIResult
 
-    output_path: Path
-    success: bool
-    stdout: str
-    stderr: str
+
+def _fmt_minute(dt: datetime) -> str:
+    """Format a datetime the way dcpomatic2_kdm_cli expects (YYYY-MM-DD HH:MM)."""
+    # Key the cache on naive wall-clock time: aware datetimes for the same
+    # instant in different zones compare equal but format differently.
+    return _fmt_minute_cached(dt.replace(second=0, microsecond=0, tzinfo=None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_minute_cached(dt: datetime) -> str:
+    # Direct integer formatting; about twice as fast as strftime.
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# Seconds for which a successful existence check is trusted. Batch jobs check
+# the same project/certificate/DKDM over and over; misses are never cached.
+_EXISTS_TTL = 5.0
+
+# Absolute path -> time.monotonic() of its last successful existence check.
+_exists_cache: dict[str, float] = {}
+
+
+def _exists_cached(path: Path) -> bool:
+    """Path.exists(), skipping the stat() for recently seen paths."""
+    key = os.path.abspath(path)
+    now = time.monotonic()
+    checked = _exists_cache.get(key)
+    if checked is not None and now - checked < _EXISTS_TTL:
+        return True
+    if os.path.exists(key):
+        _exists_cache[key] = now
+        return True
+    _exists_cache.pop(key, None)
+    return False
+
+
+# Absolute output directory -> time.monotonic() of its last mkdir(). Shares
+# _EXISTS_TTL so a directory removed behind our back is recreated shortly after.
+_ensured_dirs: dict[str, float] = {}
+
+
+def _ensure(dir_path: Path) -> None:
+    """mkdir(parents=True, exist_ok=True), skipped for recently ensured dirs."""
+    key = os.path.abspath(dir_path)
+    now = time.monotonic()
+    ensured = _ensured_dirs.get(key)
+    if ensured is not None and now - ensured < _EXISTS_TTL:
+        return
+    Path(key).mkdir(parents=True, exist_ok=True)
+    _ensured_dirs[key] = now
 
 
 class KDMGenerator:
     """Wrapper for dcpomatic2_kdm_cli to generate Key Delivery Messages."""
 
-    def __init__(self, dcpomatic_kdm_path: str | None = None):
+    def __init__(self, dcpomatic_kdm_path: str | os.PathLike[str] | None = None):
         """
         Initialize the KDM generator.
 
@@ -70,10 +118,69 @@ class KDMGenerator:
         Raises:
             KDMGenerationError: If KDM generation fails.
         """
+        cmd = self._prepare_generate(
+            project,
+            certificate,
+            output,
+            valid_from,
+            valid_to,
+            kdm_type,
+            cinema_name,
+            screen_name,
+        )
+        return self.runner.run(*cmd, output_path=output)
 
-        output.parent.mkdir(parents=True, exist_ok=True)
+    async def generate_async(
+        self,
+        project: Path,
+        certificate: Path,
+        output: Path,
+        valid_from: datetime,
+        valid_to: datetime,
+        kdm_type: KDMType = KDMType.MODIFIED_TRANSITIONAL_1,
+        cinema_name: str | None = None,
+        screen_name: str | None = None,
+    ) -> CLIResult:
+        """
+        Asynchronous counterpart of generate().
 
-        cmd = [
+        Several KDMs can be generated concurrently in one event loop with
+        asyncio.gather(). Takes the same arguments as generate().
+        """
+        cmd = self._prepare_generate(
+            project,
+            certificate,
+            output,
+            valid_from,
+            valid_to,
+            kdm_type,
+            cinema_name,
+            screen_name,
+        )
+        return await self.runner.run_async(*cmd, output_path=output)
+
+    def _prepare_generate(
+        self,
+        project: Path,
+        certificate: Path,
+        output: Path,
+        valid_from: datetime,
+        valid_to: datetime,
+        kdm_type: KDMType,
+        cinema_name: str | None,
+        screen_name: str | None,
+    ) -> tuple[str, ...]:
+        """Create the output directory and build the generate() arguments."""
+        if not _exists_cached(project):
+            raise KDMGenerationError(f"Project not found: {project}")
+
+        if not _exists_cached(certificate):
+            raise KDMGenerationError(f"Certificate not found: {certificate}")
+
+        _ensure(output.parent)
+
+        # Single tuple display; optional flags are spliced in place.
+        return (
             "-o",
             str(output),
             "-K",
@@ -81,20 +188,54 @@ class KDMGenerator:
             "-S",
             str(certificate),
             "-f",
-            valid_from.strftime("%Y-%m-%d %H:%M"),
+            _fmt_minute(valid_from),
             "-t",
-            valid_to.strftime("%Y-%m-%d %H:%M"),
-        ]
+            _fmt_minute(valid_to),
+            *(("-c", cinema_name) if cinema_name else ()),
+            *(("-s", screen_name) if screen_name else ()),
+            str(project),
+        )
+
+    def generate_many(
+        self,
+        jobs: Sequence[Mapping[str, Any]],
+        max_workers: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[CLIResult | Exception]:
+        """
+        Generate several KDMs concurrently.
 
-        if cinema_name:
-            cmd.extend(["-c", cinema_name])
+        Each job is a mapping of keyword arguments for generate(). Jobs run
+        on a thread pool, one dcpomatic2_kdm_cli process per job.
 
-        if screen_name:
-            cmd.extend(["-s", screen_name])
+        Args:
+            jobs: Keyword arguments for each generate() call.
+            max_workers: Maximum number of concurrent processes.
+                        If None, uses the number of CPUs.
+            return_exceptions: If True, any exception raised by a job is
+                              placed in the result list instead of being
+                              raised.
 
-        cmd.append(str(project))
+        Returns:
+            One CLIResult (or exception) per job, in the order of jobs.
 
-        return self.runner.run(*cmd, output_path=output)
+        Raises:
+            Exception: The first failed job's exception (e.g.
+                      KDMGenerationError or CLIError) if return_exceptions
+                      is False. All jobs still run to completion first.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(job: Mapping[str, Any]) -> CLIResult | Exception:
+            try:
+                return self.generate(**job)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(run, jobs))
 
     def generate_from_dkdm(
         self,
@@ -122,15 +263,15 @@ class KDMGenerator:
         Raises:
             CLIError: If KDM generation fails.
         """
-        if not dkdm.exists():
+        if not _exists_cached(dkdm):
             raise KDMGenerationError(f"DKDM not found: {dkdm}")
 
-        if not certificate.exists():
+        if not _exists_cached(certificate):
             raise KDMGenerationError(f"Certificate not found: {certificate}")
 
-        output.parent.mkdir(parents=True, exist_ok=True)
+        _ensure(output.parent)
 
-        cmd = [
+        cmd = (
             "-o",
             str(output),
             "-K",
@@ -138,12 +279,12 @@ class KDMGenerator:
             "-S",
             str(certificate),
             "-f",
-            valid_from.strftime("%Y-%m-%d %H:%M"),
+            _fmt_minute(valid_from),
             "-t",
-            valid_to.strftime("%Y-%m-%d %H:%M"),
+            _fmt_minute(valid_to),
             "-D",
             str(dkdm),
-        ]
+        )
 
         return self.runner.run(*cmd, output_path=output)
 
@@ -179,15 +320,15 @@ class KDMGenerator:
         Raises:
             KDMGenerationError: If DKDM creation fails.
         """
-        if not project.exists():
+        if not _exists_cached(project):
             raise KDMGenerationError(f"Project not found: {project}")
 
-        if not certificate.exists():
+        if not _exists_cached(certificate):
             raise KDMGenerationError(f"Certificate not found: {certificate}")
 
-        output.parent.mkdir(parents=True, exist_ok=True)
+        _ensure(output.parent)
 
-        cmd = [
+        cmd = (
             "-o",
             str(output),
             "-F",
@@ -195,10 +336,34 @@ class KDMGenerator:
             "-C",
             str(certificate),
             "-f",
-            valid_from.strftime("%Y-%m-%d %H:%M"),
+            _fmt_minute(valid_from),
             "-t",
-            valid_to.strftime("%Y-%m-%d %H:%M"),
+            _fmt_minute(valid_to),
             str(project),
-        ]
+        )
 
         return self.runner.run(*cmd, output_path=output, error_prefix="DKDM creation")
+
+
+def get_generator(
+    dcpomatic_kdm_path: str | os.PathLike[str] | None = None,
+) -> KDMGenerator:
+    """
+    Get a shared KDMGenerator for the given binary path.
+
+    Generators hold no per-call state, so the returned instance is safe to
+    reuse (and share between threads). Repeated calls skip binary lookup
+    and validation.
+
+    Args:
+        dcpomatic_kdm_path: Path to dcpomatic2_kdm_cli binary.
+                           If None, searches in PATH.
+    """
+    # Normalise so str and Path spellings of one binary share an instance.
+    key = os.fspath(dcpomatic_kdm_path) if dcpomatic_kdm_path is not None else None
+    return _get_generator_cached(key)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_generator_cached(dcpomatic_kdm_path: str | None) -> KDMGenerator:
+    return KDMGenerator(dcpomatic_kdm_path)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
@@ -104,7 +105,7 @@ class DCPProjectResult:
 class DCPProjectCreator:
     """Wrapper for dcpomatic2_create to create DCP-o-matic projects from video/audio files."""
 
-    def __init__(self, dcpomatic_create_path: str | None = None):
+    def __init__(self, dcpomatic_create_path: str | os.PathLike[str] | None = None):
         """
         Initialize the DCP project creator.
 
@@ -238,7 +239,7 @@ class DCPProjectCreator:
         dimension: Dimension | None = None,
         no_use_isdcf_name: bool = False,
         no_sign: bool = False,
-        dcpomatic_cli_path: str | None = None,
+        dcpomatic_cli_path: str | os.PathLike[str] | None = None,
     ) -> tuple[CLIResult, CLIResult]:
         """
         Create a DCP-o-matic project and build the DCP in one step.
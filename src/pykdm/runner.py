@@ -1,59 +1,375 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import os
+import re
 import shutil
-import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Literal
 
 from pykdm.exceptions import CLIError
 
+# subprocess (and asyncio even more so) are comparatively slow to import, so
+# the methods below import them on first use.
+if TYPE_CHECKING:
+    import subprocess
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CLIResult:
-    """Result of a CLI command execution."""
+    """Result of a CLI command execution.
+
+    The command output is kept as captured (usually undecoded bytes) in
+    ``raw_stdout``/``raw_stderr``. ``stdout``/``stderr`` decode it on access,
+    so callers that only check ``success`` never pay for decoding.
+    """
 
     output_path: Path
     success: bool
-    stdout: str
-    stderr: str
+    raw_stdout: str | bytes
+    raw_stderr: str | bytes
+
+    @property
+    def stdout(self) -> str:
+        return _decode(self.raw_stdout)
+
+    @property
+    def stderr(self) -> str:
+        return _decode(self.raw_stderr)
+
+
+def _decode(output: str | bytes) -> str:
+    if isinstance(output, bytes):
+        return output.decode(errors="replace")
+    return output
+
+
+# How command output is collected: decoded text, raw bytes, or stdout
+# discarded (stderr is still captured as text for error messages).
+Capture = Literal["text", "bytes", "none"]
+
+# In-process replacement for the binary: takes the argument list and returns
+# (returncode, stdout, stderr) like the CLI would.
+InProcessCallable = Callable[[list[str]], tuple[int, str, str]]
+
+# Matches the percentage in DCP-o-matic progress lines, e.g. "Transcoding; 42%".
+_PROGRESS_RE = re.compile(r"(\d+(?:\.\d+)?)%")
+
+# Number of trailing stdout lines kept when streaming a long-running command.
+_STREAM_TAIL_LINES = 1000
+
+
+# Binary name -> path found in PATH. Misses are never cached, so a binary
+# installed (or a PATH changed) later in the process is still picked up.
+_which_cache: dict[str, str] = {}
+
+
+def _which_cached(binary_name: str) -> str | None:
+    """Resolve a binary in PATH once per process."""
+    found = _which_cache.get(binary_name)
+    if found is None:
+        found = shutil.which(binary_name)
+        if found is not None:
+            _which_cache[binary_name] = found
+    return found
+
+
+def _report_progress(line: str, progress_callback: Callable[[float], None]) -> None:
+    match = _PROGRESS_RE.search(line)
+    if match:
+        progress_callback(float(match.group(1)) / 100)
 
 
 class Runner:
-    def __init__(self, binary_name: str, binary_path: str | None = None):
+    def __init__(
+        self,
+        binary_name: str,
+        binary_path: str | os.PathLike[str] | None = None,
+        in_process_callable: InProcessCallable | None = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            binary_name: Name of the binary, looked up in PATH if needed.
+            binary_path: Explicit path to the binary.
+            in_process_callable: Optional in-process implementation of the
+                               binary. When set, commands call it directly
+                               instead of spawning a process, and no binary
+                               lookup is done (binary_path is None).
+        """
         self.binary_name = binary_name
-        if binary_path:
-            self.binary_path = Path(binary_path)
-            if not self.binary_path.exists():
+        self.in_process_callable = in_process_callable
+        if in_process_callable is not None:
+            path = None
+        elif binary_path:
+            path = Path(binary_path)
+            if not path.exists():
                 raise CLIError(f"{binary_name} not found at {binary_path}")
         else:
-            found = shutil.which(binary_name)
+            found = _which_cached(binary_name)
             if not found:
                 raise CLIError(f"{binary_name} not found in PATH.")
-            self.binary_path = Path(found)
+            path = Path(found)
+
+        # The string form is kept alongside the Path so building a command
+        # line does not convert it on every call; binary_path is read-only
+        # so the two cannot drift apart.
+        self._binary_path = path
+        self._binary_path_str = os.fspath(path) if path is not None else None
+
+        # (binary mtime, version string) from the last successful --version.
+        self._version: tuple[int | None, str] | None = None
+
+        if os.environ.get("PYKDM_PREWARM") == "1":
+            self.prewarm()
+
+    @property
+    def binary_path(self) -> Path | None:
+        """Path to the binary (None for in-process runners)."""
+        return self._binary_path
+
+    def execute(
+        self, *args: str, error_prefix, capture: Capture = "text"
+    ) -> subprocess.CompletedProcess:
+        if self.in_process_callable is not None:
+            return self._execute_in_process(
+                *args, error_prefix=error_prefix, capture=capture
+            )
+
+        import subprocess
+
+        # Only output redirection is configured: no preexec_fn, cwd, env,
+        # pass_fds, user/group or session changes. That keeps the call
+        # eligible for CPython's vfork()/posix_spawn() fast path, so a
+        # large parent process does not pay for a fork() page-table copy.
+        cmd = [self._binary_path_str, *args]
+        if capture == "text":
+            kwargs = {"capture_output": True, "text": True}
+        elif capture == "bytes":
+            kwargs = {"capture_output": True}
+        else:
+            kwargs = {
+                "stdout": subprocess.DEVNULL,
+                "stderr": subprocess.PIPE,
+                "text": True,
+            }
+        try:
+            return subprocess.run(cmd, **kwargs)
+        except OSError as e:
+            raise CLIError(f"{error_prefix} failed: {e}")
+
+    def _execute_in_process(
+        self, *args: str, error_prefix: str, capture: Capture = "text"
+    ) -> subprocess.CompletedProcess:
+        import subprocess
+
+        try:
+            returncode, stdout, stderr = self.in_process_callable(list(args))
+        except OSError as e:
+            raise CLIError(f"{error_prefix} failed: {e}")
+        if capture == "bytes":
+            stdout, stderr = stdout.encode(), stderr.encode()
+        elif capture == "none":
+            stdout = None
+        return subprocess.CompletedProcess(
+            [self.binary_name, *args], returncode, stdout, stderr
+        )
 
-    def execute(self, *args: str, error_prefix) -> subprocess.CompletedProcess:
-        cmd = [str(self.binary_path), *args]
+    async def execute_async(
+        self, *args: str, error_prefix: str, capture: Capture = "text"
+    ) -> subprocess.CompletedProcess:
+        """Asynchronous counterpart of execute()."""
+        import asyncio
+        import subprocess
+
+        if self.in_process_callable is not None:
+            return await asyncio.to_thread(
+                self._execute_in_process,
+                *args,
+                error_prefix=error_prefix,
+                capture=capture,
+            )
+
+        cmd = [self._binary_path_str, *args]
+        stdout_pipe = (
+            asyncio.subprocess.DEVNULL if capture == "none" else asyncio.subprocess.PIPE
+        )
         try:
-            return subprocess.run(cmd, capture_output=True, text=True)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=stdout_pipe, stderr=asyncio.subprocess.PIPE
+            )
         except OSError as e:
             raise CLIError(f"{error_prefix} failed: {e}")
 
+        try:
+            stdout, stderr = await proc.communicate()
+        except BaseException:
+            # Cancelled (or interrupted): do not leave the command running
+            # and writing its output behind the caller's back. It may have
+            # exited already, which must not mask the original exception.
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+            raise
+        if capture != "bytes":
+            stdout = stdout.decode() if stdout is not None else None
+            stderr = stderr.decode()
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    def stream(
+        self,
+        *args: str,
+        error_prefix: str,
+        progress_callback: Callable[[float], None],
+    ) -> subprocess.CompletedProcess:
+        """Execute the binary, reporting progress while it runs.
+
+        Stdout is read line by line and every percentage found is passed to
+        ``progress_callback`` as a fraction (0.0-1.0). Only the last
+        ``_STREAM_TAIL_LINES`` lines of stdout are kept.
+        """
+        if self.in_process_callable is not None:
+            result = self._execute_in_process(*args, error_prefix=error_prefix)
+            for line in result.stdout.splitlines():
+                _report_progress(line, progress_callback)
+            return result
+
+        import subprocess
+
+        cmd = [self._binary_path_str, *args]
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
+                text=True,
+            )
+        except OSError as e:
+            raise CLIError(f"{error_prefix} failed: {e}")
+
+        with proc:
+            # Drain stderr concurrently so a chatty child cannot block on it.
+            stderr: list[str] = []
+            drain = threading.Thread(target=lambda: stderr.append(proc.stderr.read()))
+            drain.start()
+
+            lines: collections.deque[str] = collections.deque(maxlen=_STREAM_TAIL_LINES)
+            for line in proc.stdout:
+                lines.append(line)
+                _report_progress(line, progress_callback)
+
+            drain.join()
+            returncode = proc.wait()
+
+        return subprocess.CompletedProcess(
+            cmd, returncode, "".join(lines), "".join(stderr)
+        )
+
     def run(
-        self, *args: str, output_path: Path, error_prefix: str = "Command"
+        self,
+        *args: str,
+        output_path: Path,
+        error_prefix: str = "Command",
+        progress_callback: Callable[[float], None] | None = None,
+        capture: Capture = "bytes",
     ) -> CLIResult:
-        result = self.execute(*args, error_prefix=error_prefix)
+        """Execute the binary and raise CLIError on a non-zero exit.
+
+        ``capture`` selects how output is collected: raw bytes (default,
+        decoded only when the result's ``stdout``/``stderr`` is read), text,
+        or ``"none"`` to discard stdout. Streaming with ``progress_callback``
+        always uses text.
+        """
+        if progress_callback is None:
+            result = self.execute(*args, error_prefix=error_prefix, capture=capture)
+        else:
+            result = self.stream(
+                *args, error_prefix=error_prefix, progress_callback=progress_callback
+            )
+
+        return self._to_result(result, output_path, error_prefix)
 
+    async def run_async(
+        self,
+        *args: str,
+        output_path: Path,
+        error_prefix: str = "Command",
+        capture: Capture = "bytes",
+    ) -> CLIResult:
+        """Asynchronous counterpart of run()."""
+        result = await self.execute_async(
+            *args, error_prefix=error_prefix, capture=capture
+        )
+        return self._to_result(result, output_path, error_prefix)
+
+    def _to_result(
+        self,
+        result: subprocess.CompletedProcess,
+        output_path: Path,
+        error_prefix: str,
+    ) -> CLIResult:
         if result.returncode != 0:
             raise CLIError(
-                f"{error_prefix} failed (exit code {result.returncode}):\n{result.stderr}"
+                f"{error_prefix} failed (exit code {result.returncode}):\n"
+                f"{_decode(result.stderr)}"
             )
 
         return CLIResult(
             output_path=output_path,
             success=True,
-            stdout=result.stdout,
-            stderr=result.stderr,
+            raw_stdout=result.stdout if result.stdout is not None else b"",
+            raw_stderr=result.stderr,
         )
 
     def version(self) -> str:
-        """Get the binary version."""
+        """Get the binary version.
+
+        The result is cached and only re-queried if the binary's
+        modification time changes (e.g. it was upgraded in place).
+        """
+        key = self._binary_mtime()
+        if self._version is not None and self._version[0] == key:
+            return self._version[1]
+
         result = self.execute("--version", error_prefix="Version check")
-        return result.stdout.strip()
+        version = result.stdout.strip()
+        if result.returncode == 0:
+            self._version = (key, version)
+        return version
+
+    def prewarm(self) -> threading.Thread | None:
+        """Run ``--version`` in the background to warm up the binary.
+
+        The first exec of a binary pays for loading it and its shared
+        libraries from disk. Doing that ahead of the first real command
+        hides the latency (and caches the version as a side effect). Also
+        enabled for every new Runner by setting ``PYKDM_PREWARM=1``.
+
+        Returns:
+            The background thread, or None for in-process runners.
+        """
+        if self.in_process_callable is not None:
+            return None
+
+        def warm() -> None:
+            try:
+                self.version()
+            except CLIError:
+                pass
+
+        thread = threading.Thread(target=warm, daemon=True)
+        thread.start()
+        return thread
+
+    def _binary_mtime(self) -> int | None:
+        if self.binary_path is None:
+            return None
+        try:
+            return self.binary_path.stat().st_mtime_ns
+        except OSError:
+            return None
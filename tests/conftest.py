@@ -3,6 +3,25 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from pykdm import kdm, runner
+from pykdm.certs import _load_pem_cached
+
+
+def _clear_caches():
+    runner._which_cache.clear()
+    kdm._get_generator_cached.cache_clear()
+    kdm._exists_cache.clear()
+    kdm._ensured_dirs.clear()
+    _load_pem_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset the module-level caches so tests do not leak into each other."""
+    _clear_caches()
+    yield
+    _clear_caches()
+
 
 @pytest.fixture
 def tmp_output(tmp_path):
@@ -22,7 +41,7 @@ def fake_binary(tmp_path):
 @pytest.fixture
 def mock_which():
     """Patch shutil.which to return a fake path."""
-    with patch("pykdm.runner.shutil.which") as mock:
+    with patch("shutil.which") as mock:
         mock.return_value = "/usr/bin/fake_binary"
         yield mock
 
@@ -30,7 +49,7 @@ def mock_which():
 @pytest.fixture
 def mock_subprocess_run():
     """Patch subprocess.run to return a successful result."""
-    with patch("pykdm.runner.subprocess.run") as mock:
+    with patch("subprocess.run") as mock:
         result = MagicMock(spec=subprocess.CompletedProcess)
         result.returncode = 0
         result.stdout = ""
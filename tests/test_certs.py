@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from pykdm.certs import _load_pem_cached, load_pem
+
+
+class TestLoadPem:
+    def test_reads_file_once(self, sample_certificate):
+        assert load_pem(sample_certificate) == b"FAKE CERT"
+
+        assert load_pem(str(sample_certificate)) == b"FAKE CERT"
+        assert _load_pem_cached.cache_info().misses == 1
+
+    def test_rereads_after_resize(self, sample_certificate):
+        load_pem(sample_certificate)
+        stat = sample_certificate.stat()
+
+        sample_certificate.write_text("LONGER CERT")
+        os.utime(sample_certificate, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_pem(sample_certificate) == b"LONGER CERT"
+
+    def test_rereads_after_atomic_replace(self, sample_certificate):
+        load_pem(sample_certificate)
+        stat = sample_certificate.stat()
+
+        replacement = sample_certificate.with_name("new.pem")
+        replacement.write_text("NEW1 CERT")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, sample_certificate)
+
+        assert load_pem(sample_certificate) == b"NEW1 CERT"
+
+    def test_relative_paths_are_keyed_absolute(self, sample_certificate, monkeypatch):
+        monkeypatch.chdir(sample_certificate.parent)
+
+        assert load_pem(sample_certificate.name) == b"FAKE CERT"
+        assert load_pem(sample_certificate) == b"FAKE CERT"
+        assert _load_pem_cached.cache_info().misses == 1
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_pem(tmp_path / "missing.pem")
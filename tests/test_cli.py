@@ -0,0 +1,152 @@
+from datetime import datetime
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from pykdm.cli import cli, parse_datetime
+
+
+class TestParseDatetime:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2025-01-01", datetime(2025, 1, 1)),
+            ("2025-01-01 10:30", datetime(2025, 1, 1, 10, 30)),
+            ("2025-1-1", datetime(2025, 1, 1)),
+            ("2025-01-01 1:00", datetime(2025, 1, 1, 1, 0)),
+        ],
+    )
+    def test_accepts_documented_formats(self, value, expected):
+        assert parse_datetime(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2025-01-01 10",
+            "20250101",
+            "2025-W01-1",
+            "2025-01-01T10:00",
+            "2025-01-01 10:00:00",
+            "2025-01-01 10:00:00.5",
+            "2025-01-01 10:00+05:00",
+            "2025-01-01 10:00Z",
+        ],
+    )
+    def test_rejects_other_iso_forms(self, value):
+        with pytest.raises(click.BadParameter):
+            parse_datetime(value)
+
+
+@pytest.fixture
+def fake_dcpomatic(tmp_path):
+    """Fake dcpomatic binary that logs its arguments and fails on bad.mp4."""
+    log = tmp_path / "calls.log"
+    binary = tmp_path / "fake_dcpomatic"
+    binary.write_text(
+        f'#!/bin/sh\necho "$@" >> {log}\ncase "$*" in */bad.mp4*) exit 2 ;; esac\n'
+    )
+    binary.chmod(0o755)
+    return binary, log
+
+
+@pytest.fixture
+def videos(tmp_path):
+    def make(*names):
+        paths = []
+        for name in names:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"\x00")
+            paths.append(path)
+        return paths
+
+    return make
+
+
+class TestCreateFromVideoPerFile:
+    def test_creates_one_project_per_file(self, fake_dcpomatic, videos, tmp_path):
+        binary, log = fake_dcpomatic
+        a, b = videos("a.mp4", "b.mp4")
+        output = tmp_path / "projects"
+        dcp_output = tmp_path / "dcps"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "dcp",
+                "create-from-video",
+                str(a),
+                str(b),
+                "-o",
+                str(output),
+                "--per-file",
+                "-j",
+                "2",
+                "--build",
+                "--dcp-output",
+                str(dcp_output),
+                "--bin-path",
+                str(binary),
+                "--cli-bin-path",
+                str(binary),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        calls = log.read_text().splitlines()
+        for stem, video in (("a", a), ("b", b)):
+            assert f"-o {output / stem} {video}" in calls
+            assert f"-o {dcp_output / stem} {output / stem}" in calls
+            assert f"{video.name}: project created at {output / stem}" in result.output
+            assert f"{video.name}: DCP created at {dcp_output / stem}" in result.output
+
+    def test_rejects_duplicate_stems(self, fake_dcpomatic, videos, tmp_path):
+        binary, log = fake_dcpomatic
+        first, second = videos("one/clip.mp4", "two/clip.mov")
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "dcp",
+                "create-from-video",
+                str(first),
+                str(second),
+                "-o",
+                str(tmp_path / "projects"),
+                "--per-file",
+                "--bin-path",
+                str(binary),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Duplicate content file names with --per-file: clip" in result.output
+        assert not log.exists()
+
+    def test_failures_are_reported_per_file(self, fake_dcpomatic, videos, tmp_path):
+        binary, _ = fake_dcpomatic
+        good, bad = videos("good.mp4", "bad.mp4")
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "dcp",
+                "create-from-video",
+                str(good),
+                str(bad),
+                "-o",
+                str(tmp_path / "projects"),
+                "--per-file",
+                "-j",
+                "2",
+                "--bin-path",
+                str(binary),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "good.mp4: project created at" in result.output
+        assert "bad.mp4: Project creation failed (exit code 2)" in result.output
+        assert "1 of 2 file(s) failed" in result.output
@@ -0,0 +1,48 @@
+import warnings
+from unittest.mock import patch
+
+import pytest
+
+from pykdm.dcp import DCPCreator
+from pykdm.exceptions import DCPCreationError
+
+
+class TestDCPCreatorAESCheck:
+    def test_encrypt_warns_without_hardware_aes(
+        self, mock_which, mock_subprocess_run, sample_project_dir
+    ):
+        creator = DCPCreator()
+        with patch("pykdm.dcp._cpu_has_aes", return_value=False):
+            with pytest.warns(RuntimeWarning, match="AES-NI"):
+                creator.create(project=sample_project_dir, encrypt=True)
+
+        assert "-e" in mock_subprocess_run.call_args[0][0]
+
+    def test_encrypt_raises_when_aes_ni_required(
+        self, mock_which, mock_subprocess_run, sample_project_dir
+    ):
+        creator = DCPCreator(require_aes_ni=True)
+        with patch("pykdm.dcp._cpu_has_aes", return_value=False):
+            with pytest.raises(DCPCreationError, match="AES-NI"):
+                creator.create(project=sample_project_dir, encrypt=True)
+
+        assert not mock_subprocess_run.called
+
+    @pytest.mark.parametrize("has_aes", [True, None])
+    def test_no_warning_with_aes_or_unknown_cpu(
+        self, mock_which, mock_subprocess_run, sample_project_dir, has_aes
+    ):
+        creator = DCPCreator(require_aes_ni=True)
+        with patch("pykdm.dcp._cpu_has_aes", return_value=has_aes):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                creator.create(project=sample_project_dir, encrypt=True)
+
+    def test_unencrypted_skips_check(
+        self, mock_which, mock_subprocess_run, sample_project_dir
+    ):
+        creator = DCPCreator(require_aes_ni=True)
+        with patch("pykdm.dcp._cpu_has_aes", return_value=False) as mock_aes:
+            creator.create(project=sample_project_dir)
+
+        assert not mock_aes.called
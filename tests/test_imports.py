@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+import click
+
+import pykdm
+from pykdm.cli import cli
+
+SRC = os.path.dirname(os.path.dirname(pykdm.__file__))
+
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter, so module state is not shared."""
+    env = {**os.environ, "PYTHONPATH": SRC}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def loaded_modules(code: str, *names: str) -> list[str]:
+    """Run code in a fresh interpreter and return which of names it imported."""
+    out = run_python(
+        f"{code}\nimport sys\nprint(*(n for n in {names!r} if n in sys.modules))"
+    )
+    # The module list is the last line; the code itself may print before it.
+    return out.splitlines()[-1].split()
+
+
+class TestPackageImport:
+    def test_bare_import_stays_light(self):
+        heavy = ("pykdm.kdm", "pykdm.project", "pykdm.certificate", "cryptography")
+
+        assert loaded_modules("import pykdm", *heavy) == []
+
+    def test_process_modules_are_imported_on_first_use(self):
+        for code in ("import pykdm", "import pykdm.kdm"):
+            assert loaded_modules(code, "subprocess", "asyncio") == []
+
+    def test_submodules_resolve_after_bare_import(self):
+        out = run_python(
+            "import pykdm\n"
+            "print(pykdm.kdm.KDMGenerator.__name__, pykdm.project.__name__,"
+            " pykdm.certificate.__name__)"
+        )
+
+        assert out.split() == ["KDMGenerator", "pykdm.project", "pykdm.certificate"]
+
+
+class TestCLIImports:
+    def test_dcp_version_skips_unrelated_modules(self, fake_binary):
+        fake_binary.write_text("#!/bin/sh\necho 2.16.0\n")
+        code = (
+            "from pykdm.cli import cli\n"
+            f"cli(['dcp', 'version', '--bin-path', {str(fake_binary)!r}],"
+            " standalone_mode=False)"
+        )
+
+        loaded = loaded_modules(
+            code, "pykdm.project", "pykdm.kdm", "pykdm.certificate", "cryptography"
+        )
+
+        assert loaded == []
+
+    def test_list_commands_lists_every_subcommand(self):
+        ctx = click.Context(cli)
+        listed = {
+            name: cli.get_command(ctx, name).list_commands(ctx)
+            for name in cli.list_commands(ctx)
+        }
+
+        assert listed == {
+            "cert": ["generate", "generate-chain"],
+            "dcp": ["create", "create-from-video", "project-version", "version"],
+            "kdm": ["create-dkdm", "generate", "generate-from-dkdm", "version"],
+        }
+        for name, commands in listed.items():
+            group = cli.get_command(ctx, name)
+            for command in commands:
+                assert isinstance(group.get_command(ctx, command), click.Command)
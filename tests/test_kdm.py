@@ -0,0 +1,267 @@
+import asyncio
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from pykdm import kdm
+from pykdm.exceptions import CLIError, KDMGenerationError
+from pykdm.kdm import (
+    KDMGenerator,
+    KDMType,
+    _ensure,
+    _exists_cached,
+    _fmt_minute,
+    get_generator,
+)
+
+
+class TestGetGenerator:
+    def test_returns_shared_instance(self, mock_which):
+        generator = get_generator()
+
+        assert isinstance(generator, KDMGenerator)
+        assert get_generator() is generator
+
+    def test_instances_are_keyed_by_binary_path(self, mock_which, fake_binary):
+        assert get_generator(str(fake_binary)) is not get_generator()
+        assert get_generator(str(fake_binary)).runner.binary_path == fake_binary
+
+    def test_path_spellings_share_an_instance(self, fake_binary):
+        generator = get_generator(str(fake_binary))
+
+        assert get_generator(dcpomatic_kdm_path=str(fake_binary)) is generator
+        assert get_generator(fake_binary) is generator
+
+
+class TestFmtMinute:
+    def test_formats_to_minute_precision(self):
+        assert _fmt_minute(datetime(2025, 3, 4, 5, 6, 7, 8)) == "2025-03-04 05:06"
+
+    def test_pads_years_to_four_digits(self):
+        assert _fmt_minute(datetime(999, 1, 2, 3, 4)) == "0999-01-02 03:04"
+
+    def test_same_instant_in_different_zones_keeps_wall_clock(self):
+        utc = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+
+        assert _fmt_minute(utc) == "2025-01-01 10:00"
+        assert _fmt_minute(cet) == "2025-01-01 11:00"
+
+
+class TestExistsCached:
+    def test_positive_result_is_reused(self, sample_certificate):
+        assert _exists_cached(sample_certificate)
+        sample_certificate.unlink()
+        assert _exists_cached(sample_certificate)
+
+    def test_positive_result_expires(self, sample_certificate, monkeypatch):
+        assert _exists_cached(sample_certificate)
+        sample_certificate.unlink()
+        monkeypatch.setattr(kdm, "_EXISTS_TTL", 0.0)
+        assert not _exists_cached(sample_certificate)
+
+    def test_missing_path_is_not_cached(self, tmp_path):
+        path = tmp_path / "later.pem"
+        assert not _exists_cached(path)
+        path.touch()
+        assert _exists_cached(path)
+
+    def test_relative_paths_are_keyed_absolute(self, tmp_path, monkeypatch):
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+        (tmp_path / "first" / "cert.pem").touch()
+
+        monkeypatch.chdir(tmp_path / "first")
+        assert _exists_cached(Path("cert.pem"))
+        monkeypatch.chdir(tmp_path / "second")
+        assert not _exists_cached(Path("cert.pem"))
+
+
+class TestEnsure:
+    def test_creates_directory_once(self, tmp_path):
+        target = tmp_path / "a" / "b"
+        _ensure(target)
+        assert target.is_dir()
+
+        with patch.object(type(target), "mkdir") as mkdir:
+            _ensure(target)
+        assert not mkdir.called
+
+    def test_deleted_directory_is_recreated_after_ttl(self, tmp_path, monkeypatch):
+        target = tmp_path / "out"
+        _ensure(target)
+        target.rmdir()
+
+        monkeypatch.setattr(kdm, "_EXISTS_TTL", 0.0)
+        _ensure(target)
+        assert target.is_dir()
+
+    def test_relative_paths_are_keyed_absolute(self, tmp_path, monkeypatch):
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+
+        monkeypatch.chdir(tmp_path / "first")
+        _ensure(Path("out"))
+        monkeypatch.chdir(tmp_path / "second")
+        _ensure(Path("out"))
+
+        assert (tmp_path / "second" / "out").is_dir()
+
+
+class TestGenerate:
+    def test_builds_command_line(
+        self,
+        mock_which,
+        mock_subprocess_run,
+        sample_project_dir,
+        sample_certificate,
+        tmp_output,
+    ):
+        output = tmp_output / "out.kdm.xml"
+        KDMGenerator().generate(
+            project=sample_project_dir,
+            certificate=sample_certificate,
+            output=output,
+            valid_from=datetime(2025, 1, 1),
+            valid_to=datetime(2025, 1, 31, 23, 59),
+            kdm_type=KDMType.DCI_ANY,
+            screen_name="Screen 1",
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert cmd[1:] == [
+            "-o",
+            str(output),
+            "-K",
+            "dci-any",
+            "-S",
+            str(sample_certificate),
+            "-f",
+            "2025-01-01 00:00",
+            "-t",
+            "2025-01-31 23:59",
+            "-s",
+            "Screen 1",
+            str(sample_project_dir),
+        ]
+
+    def test_raises_when_certificate_missing(
+        self, mock_which, mock_subprocess_run, sample_project_dir, tmp_path
+    ):
+        with pytest.raises(KDMGenerationError, match="Certificate not found"):
+            KDMGenerator().generate(
+                project=sample_project_dir,
+                certificate=tmp_path / "missing.pem",
+                output=tmp_path / "out.kdm.xml",
+                valid_from=datetime(2025, 1, 1),
+                valid_to=datetime(2025, 1, 31),
+            )
+
+        assert not mock_subprocess_run.called
+
+
+class TestGenerateMany:
+    def _job(self, sample_project_dir, sample_certificate, output):
+        return {
+            "project": sample_project_dir,
+            "certificate": sample_certificate,
+            "output": output,
+            "valid_from": datetime(2025, 1, 1),
+            "valid_to": datetime(2025, 1, 31),
+        }
+
+    def test_results_follow_job_order(
+        self,
+        mock_which,
+        mock_subprocess_run,
+        sample_project_dir,
+        sample_certificate,
+        tmp_output,
+    ):
+        outputs = [tmp_output / f"{i}.kdm.xml" for i in range(5)]
+        jobs = [
+            self._job(sample_project_dir, sample_certificate, output)
+            for output in outputs
+        ]
+
+        results = KDMGenerator().generate_many(jobs, max_workers=3)
+
+        assert [r.output_path for r in results] == outputs
+        assert mock_subprocess_run.call_count == 5
+
+    def test_return_exceptions_collects_failures(
+        self, mock_which, sample_project_dir, sample_certificate, tmp_output
+    ):
+        ok = MagicMock(returncode=0, stdout="", stderr="")
+        failed = MagicMock(returncode=1, stdout="", stderr="bad certificate")
+
+        def fake_run(cmd, **kwargs):
+            return failed if "bad.kdm.xml" in cmd[2] else ok
+
+        jobs = [
+            self._job(sample_project_dir, sample_certificate, tmp_output / name)
+            for name in ("good.kdm.xml", "bad.kdm.xml")
+        ]
+        generator = KDMGenerator()
+
+        with patch("subprocess.run", side_effect=fake_run):
+            results = generator.generate_many(jobs, return_exceptions=True)
+            with pytest.raises(CLIError, match="bad certificate"):
+                generator.generate_many(jobs)
+
+        assert results[0].success is True
+        assert isinstance(results[1], CLIError)
+
+    def test_return_exceptions_collects_any_error(
+        self,
+        mock_which,
+        mock_subprocess_run,
+        sample_project_dir,
+        sample_certificate,
+        tmp_path,
+    ):
+        # A regular file where the output directory should be: mkdir() fails
+        # even when running as root, unlike a chmod'ed directory.
+        blocker = tmp_path / "not_a_dir"
+        blocker.touch()
+        jobs = [
+            self._job(sample_project_dir, sample_certificate, tmp_path / "ok.xml"),
+            self._job(sample_project_dir, sample_certificate, blocker / "kdm.xml"),
+            {"project": sample_project_dir},
+        ]
+
+        results = KDMGenerator().generate_many(jobs, return_exceptions=True)
+
+        assert results[0].success is True
+        assert isinstance(results[1], OSError)
+        assert isinstance(results[2], TypeError)
+
+
+class TestGenerateAsync:
+    def test_gather_returns_results_in_order(
+        self, fake_binary, sample_project_dir, sample_certificate, tmp_output
+    ):
+        fake_binary.write_text('#!/bin/sh\necho "$2"\n')
+        generator = KDMGenerator(str(fake_binary))
+        outputs = [tmp_output / f"{i}.kdm.xml" for i in range(3)]
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    generator.generate_async(
+                        project=sample_project_dir,
+                        certificate=sample_certificate,
+                        output=output,
+                        valid_from=datetime(2025, 1, 1),
+                        valid_to=datetime(2025, 1, 31),
+                    )
+                    for output in outputs
+                )
+            )
+
+        results = asyncio.run(main())
+
+        assert [r.output_path for r in results] == outputs
+        assert [r.stdout.strip() for r in results] == [str(o) for o in outputs]
@@ -1,6 +1,9 @@
+import asyncio
+import os
 import subprocess
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 
@@ -13,6 +16,17 @@ class TestRunnerInit:
         runner = Runner("test_bin", str(fake_binary))
         assert runner.binary_path == fake_binary
 
+    def test_binary_path_is_read_only(self, fake_binary, tmp_path):
+        runner = Runner("test_bin", str(fake_binary))
+
+        with pytest.raises(AttributeError):
+            runner.binary_path = tmp_path / "other"
+        assert runner.binary_path == fake_binary
+
+    def test_init_accepts_path_like_binary_path(self, fake_binary):
+        runner = Runner("test_bin", fake_binary)
+        assert runner.binary_path == fake_binary
+
     def test_init_with_invalid_binary_path(self, tmp_path):
         with pytest.raises(CLIError, match="not found at"):
             Runner("test_bin", str(tmp_path / "nonexistent"))
@@ -22,8 +36,26 @@ class TestRunnerInit:
         assert runner.binary_path == Path("/usr/bin/fake_binary")
         mock_which.assert_called_once_with("fake_binary")
 
+    def test_init_caches_path_lookup(self, mock_which):
+        first = Runner("fake_binary")
+        second = Runner("fake_binary")
+
+        assert first.binary_path == second.binary_path
+        mock_which.assert_called_once_with("fake_binary")
+
+    def test_failed_path_lookup_is_retried(self):
+        with patch("shutil.which", return_value=None):
+            with pytest.raises(CLIError):
+                Runner("fake_binary")
+        with patch("shutil.which", return_value="/usr/bin/fake_binary"):
+            assert Runner("fake_binary").binary_path == Path("/usr/bin/fake_binary")
+
+    def test_init_with_binary_path_skips_path_lookup(self, fake_binary, mock_which):
+        Runner("fake_binary", str(fake_binary))
+        assert not mock_which.called
+
     def test_init_raises_when_binary_not_in_path(self):
-        with patch("pykdm.runner.shutil.which", return_value=None):
+        with patch("shutil.which", return_value=None):
             with pytest.raises(CLIError, match="not found in PATH"):
                 Runner("nonexistent_binary")
 
@@ -39,10 +71,20 @@ class TestRunnerExecute:
         cmd = mock_subprocess_run.call_args[0][0]
         assert cmd == ["/usr/bin/fake_binary", "--flag", "value"]
 
+    @pytest.mark.parametrize("capture", ["text", "bytes", "none"])
+    def test_execute_keeps_spawn_fast_path_eligible(
+        self, mock_which, mock_subprocess_run, capture
+    ):
+        runner = Runner("fake_binary")
+        runner.execute("--flag", error_prefix="Test", capture=capture)
+
+        kwargs = mock_subprocess_run.call_args[1]
+        assert set(kwargs) <= {"capture_output", "text", "stdout", "stderr"}
+
     def test_execute_raises_on_os_error(self, mock_which):
         runner = Runner("fake_binary")
         with patch(
-            "pykdm.runner.subprocess.run", side_effect=OSError("exec failed")
+            "subprocess.run", side_effect=OSError("exec failed")
         ):
             with pytest.raises(CLIError, match="Test failed"):
                 runner.execute("--flag", error_prefix="Test")
@@ -60,17 +102,218 @@ class TestRunnerRun:
         assert result.success is True
         assert result.output_path == output
 
+    def test_cli_result_is_immutable(self, mock_which, mock_subprocess_run, tmp_path):
+        result = Runner("fake_binary").run("arg1", output_path=tmp_path)
+
+        with pytest.raises(AttributeError):
+            result.success = False
+        assert not hasattr(result, "__dict__")
+
     def test_run_raises_on_nonzero_exit(self, mock_which, tmp_path):
         runner = Runner("fake_binary")
         failed = MagicMock(spec=subprocess.CompletedProcess)
         failed.returncode = 1
         failed.stderr = "something went wrong"
 
-        with patch("pykdm.runner.subprocess.run", return_value=failed):
+        with patch("subprocess.run", return_value=failed):
             with pytest.raises(CLIError, match="failed"):
                 runner.run("arg1", output_path=tmp_path, error_prefix="Build")
 
 
+class TestRunnerCapture:
+    def test_capture_bytes_keeps_raw_output(self, fake_binary, tmp_path):
+        fake_binary.write_text("#!/bin/sh\necho 'café'\n", encoding="utf-8")
+        runner = Runner("test_bin", str(fake_binary))
+
+        result = runner.run(output_path=tmp_path, capture="bytes")
+
+        assert result.raw_stdout == "café\n".encode()
+        assert result.stdout == "café\n"
+
+    def test_run_defaults_to_bytes(self, mock_which, mock_subprocess_run):
+        mock_subprocess_run.return_value.stdout = b"done\n"
+        mock_subprocess_run.return_value.stderr = b""
+
+        result = Runner("fake_binary").run("arg1", output_path=Path("out"))
+
+        assert "text" not in mock_subprocess_run.call_args[1]
+        assert result.stdout == "done\n"
+        assert result.stderr == ""
+
+    def test_capture_none_discards_stdout(self, mock_which, mock_subprocess_run):
+        mock_subprocess_run.return_value.stdout = None
+        runner = Runner("fake_binary")
+
+        result = runner.run("arg1", output_path=Path("out"), capture="none")
+
+        kwargs = mock_subprocess_run.call_args[1]
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.PIPE
+        assert result.stdout == ""
+
+    def test_capture_bytes_error_message_is_decoded(self, fake_binary, tmp_path):
+        fake_binary.write_text("#!/bin/sh\necho 'bad input' >&2\nexit 1\n")
+        runner = Runner("test_bin", str(fake_binary))
+
+        with pytest.raises(CLIError, match="bad input"):
+            runner.run(output_path=tmp_path, capture="bytes")
+
+    def test_run_async_capture_none(self, fake_binary, tmp_path):
+        fake_binary.write_text("#!/bin/sh\necho 'ignored'\n")
+        runner = Runner("test_bin", str(fake_binary))
+
+        result = asyncio.run(runner.run_async(output_path=tmp_path, capture="none"))
+
+        assert result.stdout == ""
+
+
+class TestRunnerStream:
+    def test_run_reports_progress_and_collects_output(self, fake_binary, tmp_path):
+        fake_binary.write_text(
+            "#!/bin/sh\n"
+            "echo 'Transcoding; 25%'\n"
+            "echo 'Transcoding; 100%'\n"
+            "echo 'warning' >&2\n"
+        )
+        runner = Runner("test_bin", str(fake_binary))
+        progress = []
+
+        result = runner.run(output_path=tmp_path, progress_callback=progress.append)
+
+        assert progress == [0.25, 1.0]
+        assert result.stdout == "Transcoding; 25%\nTranscoding; 100%\n"
+        assert result.stderr == "warning\n"
+
+    def test_run_streaming_raises_on_nonzero_exit(self, fake_binary, tmp_path):
+        fake_binary.write_text("#!/bin/sh\necho 'boom' >&2\nexit 3\n")
+        runner = Runner("test_bin", str(fake_binary))
+
+        with pytest.raises(CLIError, match="exit code 3"):
+            runner.run(
+                output_path=tmp_path,
+                error_prefix="Build",
+                progress_callback=lambda p: None,
+            )
+
+
+class TestRunnerAsync:
+    def test_run_async_returns_cli_result(self, fake_binary, tmp_path):
+        fake_binary.write_text('#!/bin/sh\necho "args: $*"\n')
+        runner = Runner("test_bin", str(fake_binary))
+
+        result = asyncio.run(runner.run_async("a", "b", output_path=tmp_path))
+
+        assert isinstance(result, CLIResult)
+        assert result.stdout == "args: a b\n"
+        assert result.output_path == tmp_path
+
+    def test_run_async_raises_on_nonzero_exit(self, fake_binary, tmp_path):
+        fake_binary.write_text("#!/bin/sh\necho 'boom' >&2\nexit 1\n")
+        runner = Runner("test_bin", str(fake_binary))
+
+        with pytest.raises(CLIError, match="Build failed"):
+            asyncio.run(runner.run_async(output_path=tmp_path, error_prefix="Build"))
+
+    def test_cancelling_run_async_kills_the_process(self, fake_binary, tmp_path):
+        marker = tmp_path / "finished"
+        fake_binary.write_text(f"#!/bin/sh\nsleep 0.5\ntouch {marker}\n")
+        runner = Runner("test_bin", str(fake_binary))
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(
+                asyncio.wait_for(runner.run_async(output_path=tmp_path), timeout=0.1)
+            )
+
+        time.sleep(1)
+        assert not marker.exists()
+
+    def test_cancelling_after_exit_keeps_the_original_error(self, fake_binary):
+        proc = MagicMock(
+            returncode=None,
+            communicate=AsyncMock(side_effect=asyncio.CancelledError),
+            wait=AsyncMock(),
+        )
+        proc.kill.side_effect = ProcessLookupError
+
+        async def exited_process(*args, **kwargs):
+            return proc
+
+        runner = Runner("test_bin", str(fake_binary))
+        with patch("asyncio.create_subprocess_exec", exited_process):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(runner.execute_async(error_prefix="Test"))
+
+        assert proc.kill.called
+        proc.wait.assert_awaited_once()
+
+    def test_execute_async_uses_in_process_callable(self):
+        runner = Runner("fake_binary", in_process_callable=lambda args: (0, "ok", ""))
+
+        result = asyncio.run(runner.execute_async("x", error_prefix="Test"))
+
+        assert result.stdout == "ok"
+
+
+class TestRunnerPrewarm:
+    def test_prewarm_runs_version_in_background(
+        self, mock_which, mock_subprocess_run
+    ):
+        mock_subprocess_run.return_value.stdout = "2.16.0\n"
+        runner = Runner("fake_binary")
+
+        runner.prewarm().join()
+
+        assert mock_subprocess_run.call_args[0][0][1:] == ["--version"]
+        assert runner.version() == "2.16.0"
+        assert mock_subprocess_run.call_count == 1
+
+    def test_prewarm_enabled_by_environment(
+        self, mock_which, mock_subprocess_run, monkeypatch
+    ):
+        monkeypatch.setenv("PYKDM_PREWARM", "1")
+        with patch.object(Runner, "prewarm") as mock_prewarm:
+            Runner("fake_binary")
+        mock_prewarm.assert_called_once_with()
+
+
+class TestRunnerInProcess:
+    def test_in_process_callable_skips_binary_lookup(self, mock_which):
+        runner = Runner("fake_binary", in_process_callable=lambda args: (0, "", ""))
+
+        assert runner.binary_path is None
+        assert not mock_which.called
+
+    def test_execute_calls_in_process_callable(self, mock_subprocess_run):
+        calls = []
+
+        def fake_cli(args):
+            calls.append(args)
+            return 0, "done\n", ""
+
+        runner = Runner("fake_binary", in_process_callable=fake_cli)
+        result = runner.execute("--flag", "value", error_prefix="Test")
+
+        assert calls == [["--flag", "value"]]
+        assert result.returncode == 0
+        assert result.stdout == "done\n"
+        assert not mock_subprocess_run.called
+
+    def test_run_raises_on_in_process_failure(self, tmp_path):
+        runner = Runner(
+            "fake_binary", in_process_callable=lambda args: (2, "", "bad input")
+        )
+        with pytest.raises(CLIError, match="bad input"):
+            runner.run("arg1", output_path=tmp_path, error_prefix="Build")
+
+    def test_run_reports_progress_from_in_process_output(self, tmp_path):
+        runner = Runner(
+            "fake_binary", in_process_callable=lambda args: (0, "50%\n100%\n", "")
+        )
+        progress = []
+        runner.run(output_path=tmp_path, progress_callback=progress.append)
+        assert progress == [0.5, 1.0]
+
+
 class TestRunnerVersion:
     def test_version_returns_stripped_stdout(
         self, mock_which, mock_subprocess_run
@@ -78,3 +321,34 @@ class TestRunnerVersion:
         mock_subprocess_run.return_value.stdout = "  2.16.0\n"
         runner = Runner("fake_binary")
         assert runner.version() == "2.16.0"
+
+    def test_version_is_cached(self, mock_which, mock_subprocess_run):
+        mock_subprocess_run.return_value.stdout = "2.16.0\n"
+        runner = Runner("fake_binary")
+
+        assert runner.version() == "2.16.0"
+        assert runner.version() == "2.16.0"
+        assert mock_subprocess_run.call_count == 1
+
+    def test_version_requeried_when_binary_changes(
+        self, fake_binary, mock_subprocess_run
+    ):
+        mock_subprocess_run.return_value.stdout = "2.16.0\n"
+        runner = Runner("test_bin", str(fake_binary))
+        runner.version()
+
+        mtime = fake_binary.stat().st_mtime_ns
+        os.utime(fake_binary, ns=(mtime + 10**9, mtime + 10**9))
+        mock_subprocess_run.return_value.stdout = "2.18.0\n"
+
+        assert runner.version() == "2.18.0"
+        assert mock_subprocess_run.call_count == 2
+
+    def test_failed_version_check_is_not_cached(
+        self, mock_which, mock_subprocess_run
+    ):
+        mock_subprocess_run.return_value.returncode = 1
+        runner = Runner("fake_binary")
+        runner.version()
+        runner.version()
+        assert mock_subprocess_run.call_count == 2